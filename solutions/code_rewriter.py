@@ -953,52 +953,44 @@ def _simple_unreachable_analysis(json_file: str, method_id: str) -> Set[int]:
                 all_pcs.add(offset)
                 pc_to_bc[offset] = bc
             
-            # Simple reachability: BFS from PC 0
+            # Next PC of each instruction, computed once by index
+            next_pc = {}
+            for bc, next_bc in zip(bytecode, bytecode[1:]):
+                next_pc.setdefault(bc['offset'], next_bc['offset'])
+            
+            # Simple reachability: worklist from PC 0, marking each PC when it
+            # is pushed so no PC enters the worklist twice
             if 0 in all_pcs:
-                queue = [0]
-                while queue:
-                    pc = queue.pop(0)
-                    if pc in reachable or pc not in pc_to_bc:
-                        continue
-                    reachable.add(pc)
-                    
+                reachable.add(0)
+                worklist = [0]
+                mark = reachable.add
+                push = worklist.append
+                
+                while worklist:
+                    pc = worklist.pop()
                     bc = pc_to_bc[pc]
                     opr = bc.get('opr', '')
                     
                     # Add successors based on opcode
                     if opr in ('return', 'throw'):
-                        pass  # No successors
-                    elif opr == 'goto':
-                        target = bc.get('target')
-                        if target is not None:
-                            queue.append(target)
-                    elif opr in ('if', 'ifz'):
-                        target = bc.get('target')
-                        if target is not None:
-                            queue.append(target)
+                        continue  # No successors
+                    if opr in ('goto', 'if', 'ifz'):
+                        succ_pc = bc.get('target')
+                        if succ_pc in pc_to_bc and succ_pc not in reachable:
+                            mark(succ_pc)
+                            push(succ_pc)
+                    if opr != 'goto':
                         # Fall through to next instruction
-                        next_pc = _find_next_pc(bytecode, pc)
-                        if next_pc is not None:
-                            queue.append(next_pc)
-                    else:
-                        # Fall through
-                        next_pc = _find_next_pc(bytecode, pc)
-                        if next_pc is not None:
-                            queue.append(next_pc)
+                        succ_pc = next_pc.get(pc)
+                        if succ_pc in pc_to_bc and succ_pc not in reachable:
+                            mark(succ_pc)
+                            push(succ_pc)
             
             return all_pcs - reachable
     
     return set()
 
 
-def _find_next_pc(bytecode: List[dict], current_pc: int) -> Optional[int]:
-    """Find the next PC after current_pc in bytecode list."""
-    for i, bc in enumerate(bytecode):
-        if bc['offset'] == current_pc and i + 1 < len(bytecode):
-            return bytecode[i + 1]['offset']
-    return None
-
-
 # =============================================================================
 # NCR Evaluation
 # =============================================================================
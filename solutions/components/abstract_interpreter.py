@@ -1,6 +1,7 @@
 # solutions/abstract_interpreter.py
 from __future__ import annotations
 
+from collections import deque
 from typing import Dict, Iterable, Tuple, TYPE_CHECKING
 
 import jpamb
@@ -627,7 +628,8 @@ def unbounded_abstract_run(
     # =========================================================================
     # PHASE 1: WIDENING - Reach fixpoint with guaranteed termination
     # =========================================================================
-    worklist: list[PC] = [start]
+    worklist: deque[PC] = deque([start])
+    queued: set[PC] = {start}  # mirrors worklist for O(1) membership
     state: Dict[PC, PerVarFrame[SignSet]] = {start: init}
     join_counts: Dict[PC, int] = {start: 1}
     
@@ -635,7 +637,8 @@ def unbounded_abstract_run(
     visited_pcs: set[int] = set()
     
     while worklist:
-        pc = worklist.pop(0)  # FIFO for breadth-first
+        pc = worklist.popleft()  # FIFO for breadth-first
+        queued.discard(pc)
         visited_pcs.add(pc.offset)
         
         frame = state.get(pc)
@@ -662,12 +665,14 @@ def unbounded_abstract_run(
                     # Only add to worklist if state changed
                     if not (new_frame <= old_frame):
                         state[target_pc] = new_frame
-                        if target_pc not in worklist:
+                        if target_pc not in queued:
                             worklist.append(target_pc)
+                            queued.add(target_pc)
                 else:
                     state[target_pc] = out
                     join_counts[target_pc] = 1
                     worklist.append(target_pc)
+                    queued.add(target_pc)
     
     # =========================================================================
     # PHASE 2: NARROWING - Improve precision after widening fixpoint
@@ -854,13 +859,15 @@ def analyze_with_ir(
     finals: set[str] = set()
     
     # Worklist using IR successors
-    worklist: list[int] = [ir.entry_pc]
+    worklist: deque[int] = deque([ir.entry_pc])
+    queued: set[int] = {ir.entry_pc}  # mirrors worklist for O(1) membership
     state: Dict[int, PerVarFrame[SignSet]] = {ir.entry_pc: init_frame}
     
     steps = 0
     while worklist and steps < max_steps:
         steps += 1
-        pc = worklist.pop(0)
+        pc = worklist.popleft()
+        queued.discard(pc)
         visited_pcs.add(pc)
         
         frame = state.get(pc)
@@ -885,11 +892,13 @@ def analyze_with_ir(
                     new_frame = old_frame | out
                     if not (new_frame <= old_frame):
                         state[target_pc] = new_frame
-                        if target_pc not in worklist:
+                        if target_pc not in queued:
                             worklist.append(target_pc)
+                            queued.add(target_pc)
                 else:
                     state[target_pc] = out
                     worklist.append(target_pc)
+                    queued.add(target_pc)
     
     unreachable_pcs = all_pcs - visited_pcs
     return finals, visited_pcs, unreachable_pcs
@@ -1564,7 +1573,8 @@ def interval_unbounded_run(
     start = PC(method, 0)
     init = PerVarFrame(locals=dict(init_locals or {}), stack=Stack.empty(), pc=start)
     
-    worklist: list[PC] = [start]
+    worklist: deque[PC] = deque([start])
+    queued: set[PC] = {start}  # mirrors worklist for O(1) membership
     state: Dict[PC, PerVarFrame[IntervalDomain]] = {start: init}
     join_counts: Dict[PC, int] = {start: 1}
     
@@ -1572,7 +1582,8 @@ def interval_unbounded_run(
     visited_pcs: set[int] = set()
     
     while worklist:
-        pc = worklist.pop(0)
+        pc = worklist.popleft()
+        queued.discard(pc)
         visited_pcs.add(pc.offset)
         
         frame = state.get(pc)
@@ -1598,12 +1609,14 @@ def interval_unbounded_run(
                     
                     if not (new_frame <= old_frame):
                         state[target_pc] = new_frame
-                        if target_pc not in worklist:
+                        if target_pc not in queued:
                             worklist.append(target_pc)
+                            queued.add(target_pc)
                 else:
                     state[target_pc] = out
                     join_counts[target_pc] = 1
                     worklist.append(target_pc)
+                    queued.add(target_pc)
     
     return finals, visited_pcs
 
@@ -2233,7 +2246,8 @@ def product_unbounded_run(
     start = PC(method, 0)
     init = PerVarFrame(locals=dict(init_locals or {}), stack=Stack.empty(), pc=start)
     
-    worklist: list[PC] = [start]
+    worklist: deque[PC] = deque([start])
+    queued: set[PC] = {start}  # mirrors worklist for O(1) membership
     state: Dict[PC, PerVarFrame[ProductValue]] = {start: init}
     join_counts: Dict[PC, int] = {start: 1}
     
@@ -2241,7 +2255,8 @@ def product_unbounded_run(
     visited_pcs: set[int] = set()
     
     while worklist:
-        pc = worklist.pop(0)
+        pc = worklist.popleft()
+        queued.discard(pc)
         visited_pcs.add(pc.offset)
         
         frame = state.get(pc)
@@ -2266,12 +2281,14 @@ def product_unbounded_run(
                     
                     if not (new_frame <= old_frame):
                         state[target_pc] = new_frame
-                        if target_pc not in worklist:
+                        if target_pc not in queued:
                             worklist.append(target_pc)
+                            queued.add(target_pc)
                 else:
                     state[target_pc] = out
                     join_counts[target_pc] = 1
                     worklist.append(target_pc)
+                    queued.add(target_pc)
     
     return finals, visited_pcs
 
@@ -18,8 +18,9 @@ DTU 02242 Program Analysis - Group 21
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
 import jpamb
 from jpamb import jvm
@@ -34,6 +35,71 @@ from solutions.ir import NodeType
 # =============================================================================
 
 
+# Opcode class name -> NodeType
+_OPCODE_TYPE_MAP: Dict[str, NodeType] = {
+    "Push": NodeType.PUSH,
+    "Load": NodeType.LOAD,
+    "Store": NodeType.ASSIGN,
+    "Binary": NodeType.BINARY,
+    "Negate": NodeType.UNARY,
+    "Cast": NodeType.UNARY,
+    "Incr": NodeType.ASSIGN,
+    "Dup": NodeType.DUP,
+    "If": NodeType.BRANCH,
+    "Ifz": NodeType.BRANCH,
+    "Goto": NodeType.JUMP,
+    "TableSwitch": NodeType.SWITCH,
+    "LookupSwitch": NodeType.SWITCH,
+    "Return": NodeType.RETURN,
+    "Throw": NodeType.THROW,
+    "InvokeVirtual": NodeType.INVOKE,
+    "InvokeStatic": NodeType.INVOKE,
+    "InvokeSpecial": NodeType.INVOKE,
+    "InvokeInterface": NodeType.INVOKE,
+    "New": NodeType.NEW,
+    "NewArray": NodeType.NEW,
+    "ArrayLoad": NodeType.ARRAY_ACCESS,
+    "ArrayStore": NodeType.ARRAY_ACCESS,
+    "ArrayLength": NodeType.ARRAY_ACCESS,
+    "Get": NodeType.FIELD_ACCESS,
+    "Put": NodeType.FIELD_ACCESS,
+}
+
+# jvm2json "opr" string -> NodeType
+_OPR_MAP: Dict[str, NodeType] = {
+    "push": NodeType.PUSH,
+    "load": NodeType.LOAD,
+    "store": NodeType.ASSIGN,
+    "incr": NodeType.ASSIGN,
+    "binary": NodeType.BINARY,
+    "negate": NodeType.UNARY,
+    "cast": NodeType.UNARY,
+    "dup": NodeType.DUP,
+    "if": NodeType.BRANCH,
+    "ifz": NodeType.BRANCH,
+    "goto": NodeType.JUMP,
+    "tableswitch": NodeType.SWITCH,
+    "lookupswitch": NodeType.SWITCH,
+    "return": NodeType.RETURN,
+    "throw": NodeType.THROW,
+    "invoke": NodeType.INVOKE,
+    "new": NodeType.NEW,
+    "newarray": NodeType.NEW,
+    "array_load": NodeType.ARRAY_ACCESS,
+    "array_store": NodeType.ARRAY_ACCESS,
+    "arraylength": NodeType.ARRAY_ACCESS,
+    "get": NodeType.FIELD_ACCESS,
+    "put": NodeType.FIELD_ACCESS,
+}
+
+# Tag the opcode classes themselves so classification is one attribute read
+for _cls_name, _node_type in _OPCODE_TYPE_MAP.items():
+    _opcode_cls = getattr(opc, _cls_name, None)
+    if _opcode_cls is not None:
+        _opcode_cls._node_type = _node_type
+del _cls_name, _node_type, _opcode_cls
+
+
 def classify_opcode(opcode: Any) -> NodeType:
     """
     Classify an opcode into a NodeType category.
@@ -44,75 +110,22 @@ def classify_opcode(opcode: Any) -> NodeType:
     Returns:
         NodeType classification
     """
-    tname = type(opcode).__name__
-    
-    type_map = {
-        "Push": NodeType.PUSH,
-        "Load": NodeType.LOAD,
-        "Store": NodeType.ASSIGN,
-        "Binary": NodeType.BINARY,
-        "Negate": NodeType.UNARY,
-        "Cast": NodeType.UNARY,
-        "Incr": NodeType.ASSIGN,
-        "Dup": NodeType.DUP,
-        "If": NodeType.BRANCH,
-        "Ifz": NodeType.BRANCH,
-        "Goto": NodeType.JUMP,
-        "TableSwitch": NodeType.SWITCH,
-        "LookupSwitch": NodeType.SWITCH,
-        "Return": NodeType.RETURN,
-        "Throw": NodeType.THROW,
-        "InvokeVirtual": NodeType.INVOKE,
-        "InvokeStatic": NodeType.INVOKE,
-        "InvokeSpecial": NodeType.INVOKE,
-        "InvokeInterface": NodeType.INVOKE,
-        "New": NodeType.NEW,
-        "NewArray": NodeType.NEW,
-        "ArrayLoad": NodeType.ARRAY_ACCESS,
-        "ArrayStore": NodeType.ARRAY_ACCESS,
-        "ArrayLength": NodeType.ARRAY_ACCESS,
-        "Get": NodeType.FIELD_ACCESS,
-        "Put": NodeType.FIELD_ACCESS,
-    }
-    
-    return type_map.get(tname, NodeType.OTHER)
+    node_type = getattr(type(opcode), "_node_type", None)
+    if node_type is None:
+        return _OPCODE_TYPE_MAP.get(type(opcode).__name__, NodeType.OTHER)
+    return node_type
 
 
 def classify_opr(opr: str) -> NodeType:
     """Classify instruction by its operation string."""
-    opr_map = {
-        "push": NodeType.PUSH,
-        "load": NodeType.LOAD,
-        "store": NodeType.ASSIGN,
-        "incr": NodeType.ASSIGN,
-        "binary": NodeType.BINARY,
-        "negate": NodeType.UNARY,
-        "cast": NodeType.UNARY,
-        "dup": NodeType.DUP,
-        "if": NodeType.BRANCH,
-        "ifz": NodeType.BRANCH,
-        "goto": NodeType.JUMP,
-        "tableswitch": NodeType.SWITCH,
-        "lookupswitch": NodeType.SWITCH,
-        "return": NodeType.RETURN,
-        "throw": NodeType.THROW,
-        "invoke": NodeType.INVOKE,
-        "new": NodeType.NEW,
-        "newarray": NodeType.NEW,
-        "array_load": NodeType.ARRAY_ACCESS,
-        "array_store": NodeType.ARRAY_ACCESS,
-        "arraylength": NodeType.ARRAY_ACCESS,
-        "get": NodeType.FIELD_ACCESS,
-        "put": NodeType.FIELD_ACCESS,
-    }
-    return opr_map.get(opr, NodeType.OTHER)
+    return _OPR_MAP.get(opr, NodeType.OTHER)
 
 
 # =============================================================================
 # Exception Handler
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExceptionHandler:
     """
     Represents a try-catch exception handler range.
@@ -154,21 +167,169 @@ class ExceptionHandler:
         )
 
 
+# =============================================================================
+# Parsed Bytecode
+# =============================================================================
+
+class ParsedBytecode(NamedTuple):
+    """
+    Struct-of-arrays view of a method's bytecode, indexed by instruction index.
+    
+    Attributes:
+        oprs: Operation string of each instruction
+        tags: Small integer tag of each control-flow/invoke opr (_TAG_*)
+        offsets: Byte offset of each instruction (-1 if it has none)
+        targets: Resolved jump target offset of if/ifz/goto (-1 otherwise)
+        switch_targets: Resolved default + case offsets of switches (() otherwise)
+    """
+    oprs: List[str]
+    tags: array
+    offsets: array
+    targets: array
+    switch_targets: List[Tuple[int, ...]]
+
+
+# Integer tags for the oprs the CFG passes branch on; anything else is 0
+_TAG_OTHER = 0
+_TAG_IF = 1
+_TAG_IFZ = 2
+_TAG_GOTO = 3
+_TAG_RETURN = 4
+_TAG_THROW = 5
+_TAG_TABLESWITCH = 6
+_TAG_LOOKUPSWITCH = 7
+_TAG_INVOKE = 8
+
+_OPR_TAG: Dict[str, int] = {
+    "if": _TAG_IF,
+    "ifz": _TAG_IFZ,
+    "goto": _TAG_GOTO,
+    "return": _TAG_RETURN,
+    "throw": _TAG_THROW,
+    "tableswitch": _TAG_TABLESWITCH,
+    "lookupswitch": _TAG_LOOKUPSWITCH,
+    "invoke": _TAG_INVOKE,
+}
+
+_CONDITIONAL_TAGS = frozenset((_TAG_IF, _TAG_IFZ))
+_JUMP_TAGS = frozenset((_TAG_IF, _TAG_IFZ, _TAG_GOTO))
+_EXIT_TAGS = frozenset((_TAG_RETURN, _TAG_THROW))
+_SWITCH_TAGS = frozenset((_TAG_TABLESWITCH, _TAG_LOOKUPSWITCH))
+
+# Operations that never fall through to the next instruction
+_NO_FALL_THROUGH_TAGS = frozenset((_TAG_GOTO, _TAG_RETURN, _TAG_THROW, _TAG_TABLESWITCH, _TAG_LOOKUPSWITCH))
+# Operations after which the next instruction starts a new basic block
+_BLOCK_END_TAGS = frozenset((_TAG_GOTO, _TAG_RETURN, _TAG_THROW))
+
+
+def _preparse(bytecode: List[dict]) -> ParsedBytecode:
+    """Read each instruction dict once and resolve jump target indices to offsets."""
+    n = len(bytecode)
+    oprs = [inst.get("opr", "") for inst in bytecode]
+    opr_tag = _OPR_TAG.get
+    tags = array('b', [opr_tag(opr, _TAG_OTHER) for opr in oprs])
+    offsets = array('i', [inst.get("offset", -1) for inst in bytecode])
+    targets = array('i', [-1]) * n
+    switch_targets: List[Tuple[int, ...]] = [()] * n
+    
+    # In jpamb's bytecode JSON, jump targets are instruction indices (0-based
+    # position in the bytecode list), not byte offsets
+    def resolve(target_index: Any) -> int:
+        if isinstance(target_index, int) and 0 <= target_index < n:
+            offset = offsets[target_index]
+            return offset if offset >= 0 else -1
+        return -1
+    
+    for i, tag in enumerate(tags):
+        if tag in _JUMP_TAGS:
+            targets[i] = resolve(bytecode[i].get("target"))
+        elif tag in _SWITCH_TAGS:
+            inst = bytecode[i]
+            indices = [inst.get("default")]
+            # tableswitch targets are plain indices, lookupswitch targets
+            # are {match, target} dicts
+            for case in inst.get("targets", []):
+                indices.append(case.get("target") if isinstance(case, dict) else case)
+            switch_targets[i] = tuple(t for t in map(resolve, indices) if t >= 0)
+    
+    return ParsedBytecode(oprs, tags, offsets, targets, switch_targets)
+
+
+# =============================================================================
+# CFG Kernels
+# =============================================================================
+# Whole-method loops over a ParsedBytecode. They read only the arrays (never
+# the instruction dicts) and build no CFGNode objects, so CFGBuilder makes
+# one call per method instead of one method call per instruction.
+
+def _scan_once(parsed: ParsedBytecode) -> Tuple[Set[int], List[List[int]]]:
+    """
+    Leaders and normal (non-exception) successors of a method in one pass.
+    
+    The leaders are jump targets plus the instruction after a taken
+    conditional branch, goto, return or throw; the method entry and handler
+    entries are left to the caller.
+    """
+    tags, offsets, targets, switch_targets = (
+        parsed.tags, parsed.offsets, parsed.targets, parsed.switch_targets
+    )
+    last = len(offsets) - 1
+    leaders: Set[int] = set()
+    add_leader = leaders.add
+    successors: List[List[int]] = []
+    append = successors.append
+    
+    for i, tag in enumerate(tags):
+        next_offset = offsets[i + 1] if i < last else -1
+        target = targets[i]
+        
+        if tag in _SWITCH_TAGS:
+            # Switch: default + all case targets, without duplicates
+            append(list(dict.fromkeys(switch_targets[i])))
+        elif tag in _EXIT_TAGS:
+            # Return and throw have no successors
+            append([])
+        else:
+            # Conditional and sequential instructions fall through; goto
+            # does not. if/ifz/goto add their jump target.
+            succs = [next_offset] if tag != _TAG_GOTO and next_offset >= 0 else []
+            if target >= 0:
+                succs.append(target)
+            append(succs)
+        
+        if offsets[i] < 0:
+            continue
+        
+        # All targets are leaders
+        if target >= 0:
+            add_leader(target)
+        elif tag in _SWITCH_TAGS:
+            leaders.update(switch_targets[i])
+        
+        if next_offset >= 0 and (
+            (target >= 0 and tag in _CONDITIONAL_TAGS)
+            or tag in _BLOCK_END_TAGS
+        ):
+            add_leader(next_offset)
+    
+    return leaders, successors
+
+
 # =============================================================================
 # CFG Node (Simple version for dead code analysis)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CFGNode:
-    """A node in the control flow graph."""
+    """A node in the control flow graph (edges are immutable tuples once built)."""
     offset: int
     instruction: dict
-    successors: Set[int] = field(default_factory=set)
-    predecessors: Set[int] = field(default_factory=set)
+    successors: Tuple[int, ...] = ()
+    predecessors: Tuple[int, ...] = ()
     node_type: NodeType = NodeType.OTHER
     is_leader: bool = False
     basic_block_id: Optional[int] = None
-    exception_handlers: List[ExceptionHandler] = field(default_factory=list)
+    exception_handlers: Tuple[ExceptionHandler, ...] = ()
     
     @property
     def pc(self) -> int:
@@ -199,7 +360,7 @@ class CFGNode:
         return f"{opr}"
 
 
-@dataclass
+@dataclass(slots=True)
 class CFG:
     """Control Flow Graph for a method."""
     method_name: str
@@ -209,71 +370,162 @@ class CFG:
     def add_edge(self, from_offset: int, to_offset: int):
         """Add an edge from one node to another."""
         if from_offset in self.nodes and to_offset in self.nodes:
-            self.nodes[from_offset].successors.add(to_offset)
-            self.nodes[to_offset].predecessors.add(from_offset)
+            from_node = self.nodes[from_offset]
+            if to_offset not in from_node.successors:
+                from_node.successors += (to_offset,)
+                self.nodes[to_offset].predecessors += (from_offset,)
     
     def get_reachable_nodes(self) -> Set[int]:
-        """Find all nodes reachable from entry using DFS."""
-        reachable = set()
-        worklist = [self.entry_offset]
+        """Find all nodes reachable from entry with a worklist."""
+        nodes = self.nodes
+        if self.entry_offset not in nodes:
+            return set()
         
+        # Each node is pushed at most once: it is marked when pushed
+        reachable = {self.entry_offset}
+        mark = reachable.add
+        worklist = [self.entry_offset]
+        pop, push = worklist.pop, worklist.append
         while worklist:
-            offset = worklist.pop()
-            if offset in reachable or offset not in self.nodes:
-                continue
-            
-            reachable.add(offset)
-            for succ in self.nodes[offset].successors:
-                if succ not in reachable:
-                    worklist.append(succ)
+            for succ in nodes[pop()].successors:
+                if succ not in reachable and succ in nodes:
+                    mark(succ)
+                    push(succ)
         
         return reachable
     
     def get_unreachable_nodes(self) -> Set[int]:
         """Find all unreachable nodes in the CFG."""
-        reachable = self.get_reachable_nodes()
-        all_nodes = set(self.nodes.keys())
-        return all_nodes - reachable
+        return self.nodes.keys() - self.get_reachable_nodes()
 
 
-@dataclass
+@dataclass(slots=True)
 class CallGraph:
     """Call graph tracking method invocations."""
     calls: Dict[str, Set[str]] = field(default_factory=dict)
     all_methods: Set[str] = field(default_factory=set)
     
+    # Condensation computed by finalize(): method -> SCC id, SCC members, and
+    # for every SCC the frozenset of SCC ids reachable from it (itself included)
+    _comp_id: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    _comp_members: List[List[str]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _reach_comp: List[FrozenSet[int]] = field(default_factory=list, init=False, repr=False, compare=False)
+    
     def add_call(self, caller: str, callee: str):
         """Record that caller invokes callee."""
         if caller not in self.calls:
             self.calls[caller] = set()
         self.calls[caller].add(callee)
+        self._comp_id = None
     
     def add_method(self, method_name: str):
         """Register a method."""
         self.all_methods.add(method_name)
+        self._comp_id = None
+    
+    def finalize(self) -> None:
+        """
+        Collapse strongly connected components and precompute reachability.
+        
+        Runs an iterative Tarjan over the call edges. Tarjan emits components
+        callees-first, so each component's reachable set is the union of its
+        successors' sets, which are already computed when it is emitted.
+        
+        Only callers are used as roots. A callee that calls nothing becomes a
+        component of its own as soon as it is seen, without entering the
+        Tarjan stack; methods that neither call nor are called get no
+        component at all, which get_reachable_from() handles.
+        """
+        calls = self.calls
+        
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        comp_id: Dict[str, int] = {}
+        comp_members: List[List[str]] = []
+        reach_comp: List[FrozenSet[int]] = []
+        
+        for root in calls:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(calls[root]))]
+            
+            while work:
+                v, it = work[-1]
+                for w in it:
+                    if w not in index:
+                        callees = calls.get(w)
+                        if not callees:
+                            # Leaf: a finished component, never on the stack
+                            c = len(comp_members)
+                            index[w] = -1
+                            comp_id[w] = c
+                            comp_members.append([w])
+                            reach_comp.append(frozenset((c,)))
+                            continue
+                        index[w] = low[w] = len(index)
+                        stack.append(w)
+                        on_stack.add(w)
+                        work.append((w, iter(callees)))
+                        break
+                    if w in on_stack and index[w] < low[v]:
+                        low[v] = index[w]
+                else:
+                    work.pop()
+                    if work and low[v] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[v]
+                    if low[v] != index[v]:
+                        continue
+                    
+                    # v is the root of a component: pop it and its members
+                    c = len(comp_members)
+                    members = []
+                    while True:
+                        w = stack.pop()
+                        on_stack.discard(w)
+                        comp_id[w] = c
+                        members.append(w)
+                        if w == v:
+                            break
+                    comp_members.append(members)
+                    
+                    reach = {c}
+                    for m in members:
+                        for callee in calls[m]:
+                            succ = comp_id[callee]
+                            if succ != c:
+                                reach |= reach_comp[succ]
+                    reach_comp.append(frozenset(reach))
+        
+        self._comp_id = comp_id
+        self._comp_members = comp_members
+        self._reach_comp = reach_comp
     
     def get_reachable_from(self, entry_points: Set[str]) -> Set[str]:
         """Compute reachable methods from entry points."""
+        if self._comp_id is None:
+            self.finalize()
+        
         reachable = set()
-        worklist = list(entry_points)
+        comps: Set[int] = set()
+        for method in entry_points:
+            c = self._comp_id.get(method)
+            if c is None:
+                reachable.add(method)  # No component: calls nothing
+            else:
+                comps |= self._reach_comp[c]
         
-        while worklist:
-            method = worklist.pop()
-            if method in reachable:
-                continue
-            
-            reachable.add(method)
-            
-            # Add all methods called by this method
-            if method in self.calls:
-                for callee in self.calls[method]:
-                    if callee not in reachable:
-                        worklist.append(callee)
+        for c in comps:
+            reachable.update(self._comp_members[c])
         
         return reachable
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Results from bytecode syntactic analysis."""
     cfgs: Dict[str, CFG]
@@ -283,6 +535,17 @@ class AnalysisResult:
     dead_instructions: Dict[str, Set[int]]  # method -> set of dead offsets
     total_instructions: int = 0  # Total number of instructions across all methods
     
+    def copy(self) -> AnalysisResult:
+        """Copy with fresh containers; the CFGs and call graph themselves are shared."""
+        return AnalysisResult(
+            cfgs=dict(self.cfgs),
+            call_graph=self.call_graph,
+            entry_points=set(self.entry_points),
+            unreachable_methods=set(self.unreachable_methods),
+            dead_instructions={m: set(offsets) for m, offsets in self.dead_instructions.items()},
+            total_instructions=self.total_instructions,
+        )
+    
     def get_dead_instruction_count(self) -> int:
         """Get total count of dead instructions."""
         return sum(len(offsets) for offsets in self.dead_instructions.values())
@@ -294,6 +557,39 @@ class AnalysisResult:
         return (self.get_dead_instruction_count() / self.total_instructions) * 100.0
 
 
+def _method_callees(bytecode: List[dict], parsed: ParsedBytecode) -> List[str]:
+    """Qualified names of the methods invoked by bytecode, in call order."""
+    callees = []
+    for inst, tag in zip(bytecode, parsed.tags):
+        if tag == _TAG_INVOKE:
+            method_info = inst.get("method", {})
+            ref = method_info.get("ref", {})
+            callee_class = ref.get("name", "")
+            callee_name = method_info.get("name", "")
+            
+            if callee_class and callee_name:
+                callees.append(f"{callee_class}.{callee_name}")
+    return callees
+
+
+# Access flag bits relevant to entry-point detection
+_ACC_PUBLIC = 1
+_ACC_PROTECTED = 2
+_ACCESS_FLAG_BITS: Dict[str, int] = {
+    "public": _ACC_PUBLIC,
+    "protected": _ACC_PROTECTED,
+}
+_ENTRY_METHOD_NAMES = frozenset(("main", "<clinit>"))
+
+
+def _access_flags(access: List[str]) -> int:
+    """Fold a jvm2json access list into _ACC_* bits."""
+    flags = 0
+    for name in access:
+        flags |= _ACCESS_FLAG_BITS.get(name, 0)
+    return flags
+
+
 class BytecodeAnalyzer:
     """Bytecode syntactic analyzer using CFG and call graph."""
     
@@ -301,14 +597,30 @@ class BytecodeAnalyzer:
         self.suite = suite
         self.cfgs: Dict[str, CFG] = {}
         self.call_graph = CallGraph()
+        self._analysis_cache: Dict[str, AnalysisResult] = {}  # classname -> result
     
     def analyze_class(self, classname: jvm.ClassName) -> AnalysisResult:
         """
         Analyze a class and return dead code findings.
         
+        Works in two phases: the call graph is built first, then CFGs only
+        for the methods reachable from the entry points, so the result's
+        cfgs holds no unreachable methods. Results are memoized per class
+        name. Every call returns its own copy, so callers may extend the
+        dead-instruction sets, and a cache hit restores self.cfgs and
+        self.call_graph to that class.
+        
         Returns:
             AnalysisResult with CFGs, call graph, and dead code locations
         """
+        key = str(classname)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            result = cached.copy()
+            self.cfgs = result.cfgs
+            self.call_graph = result.call_graph
+            return result
+        
         try:
             cls = self.suite.findclass(classname)
         except Exception as e:
@@ -316,7 +628,13 @@ class BytecodeAnalyzer:
         
         methods = cls.get("methods", [])
         
-        # Build CFGs and call graph
+        # Fresh state per class, so earlier classes do not leak into this result
+        self.cfgs = {}
+        self.call_graph = CallGraph()
+        
+        # Phase 1: call graph only, no CFGs. Count instructions on the way.
+        with_code: Dict[str, Tuple[dict, ParsedBytecode]] = {}
+        total_instructions = 0
         for method in methods:
             method_name = method.get("name", "<unknown>")
             full_name = f"{classname}.{method_name}"
@@ -325,9 +643,11 @@ class BytecodeAnalyzer:
             
             code = method.get("code")
             if code:
-                cfg = self.build_cfg(full_name, code)
-                self.cfgs[full_name] = cfg
-                self.extract_calls(full_name, code)
+                bytecode = code.get("bytecode", [])
+                parsed = _preparse(bytecode)
+                with_code[full_name] = (code, parsed)
+                total_instructions += len(bytecode)
+                self.extract_calls(full_name, code, parsed)
         
         # Find entry points
         entry_points = self.get_entry_points(cls, classname)
@@ -336,18 +656,18 @@ class BytecodeAnalyzer:
         reachable_methods = self.call_graph.get_reachable_from(entry_points)
         unreachable_methods = self.call_graph.all_methods - reachable_methods
         
-        # Find dead instructions in reachable methods
+        # Phase 2: CFGs, and dead instructions, for reachable methods only
         dead_instructions = {}
-        for method_name, cfg in self.cfgs.items():
-            if method_name in reachable_methods:
-                unreachable = cfg.get_unreachable_nodes()
-                if unreachable:
-                    dead_instructions[method_name] = unreachable
-        
-        # Count total instructions across all methods
-        total_instructions = sum(len(cfg.nodes) for cfg in self.cfgs.values())
+        for full_name, (code, parsed) in with_code.items():
+            if full_name not in reachable_methods:
+                continue
+            cfg = self.build_cfg(full_name, code, parsed)
+            self.cfgs[full_name] = cfg
+            unreachable = cfg.get_unreachable_nodes()
+            if unreachable:
+                dead_instructions[full_name] = unreachable
         
-        return AnalysisResult(
+        result = AnalysisResult(
             cfgs=self.cfgs,
             call_graph=self.call_graph,
             entry_points=entry_points,
@@ -355,113 +675,72 @@ class BytecodeAnalyzer:
             dead_instructions=dead_instructions,
             total_instructions=total_instructions
         )
+        self._analysis_cache[key] = result.copy()
+        return result
     
-    def build_cfg(self, method_name: str, code: dict) -> CFG:
-        """Build control flow graph from bytecode."""
+    def build_cfg(
+        self,
+        method_name: str,
+        code: dict,
+        parsed: Optional[ParsedBytecode] = None,
+    ) -> CFG:
+        """Build control flow graph from bytecode (reusing parsed if given)."""
         cfg = CFG(method_name=method_name)
         bytecode = code.get("bytecode", [])
         
         if not bytecode:
             return cfg
         
-        # Build index-to-offset mapping
-        # In jpamb's bytecode JSON, jump targets are instruction indices (0-based
-        # position in the bytecode list), not byte offsets. We need to convert.
-        index_to_offset: Dict[int, int] = {}
-        for i, inst in enumerate(bytecode):
-            offset = inst.get("offset", -1)
-            if offset >= 0:
-                index_to_offset[i] = offset
-        
-        def resolve_target(target_index: int) -> int | None:
-            """Convert a target index to its corresponding byte offset."""
-            return index_to_offset.get(target_index)
+        if parsed is None:
+            parsed = _preparse(bytecode)
         
-        # Create nodes
-        for inst in bytecode:
-            offset = inst.get("offset", -1)
-            if offset >= 0:
-                cfg.nodes[offset] = CFGNode(offset=offset, instruction=inst)
+        # One pass creates the nodes with their deduplicated successors (jump
+        # targets, then fall-through); predecessors are collected afterwards.
+        # Every successor offset is itself a node.
+        tags, offsets, targets, switch_targets = (
+            parsed.tags, parsed.offsets, parsed.targets, parsed.switch_targets
+        )
+        last = len(offsets) - 1
+        no_fall_through = _NO_FALL_THROUGH_TAGS
+        nodes = cfg.nodes
+        pred_lists: Dict[int, List[int]] = {}
         
-        # Add edges based on control flow
         for i, inst in enumerate(bytecode):
-            offset = inst.get("offset", -1)
-            if offset < 0 or offset not in cfg.nodes:
+            offset = offsets[i]
+            if offset < 0:
                 continue
             
-            opr = inst.get("opr", "")
-            
-            if opr in ("if", "ifz"):
-                # Branch: add both target and fall-through edges
-                target_index = inst.get("target")
-                if target_index is not None:
-                    target_offset = resolve_target(target_index)
-                    if target_offset is not None:
-                        cfg.add_edge(offset, target_offset)
-                
-                if i + 1 < len(bytecode):
-                    next_offset = bytecode[i + 1].get("offset")
-                    if next_offset is not None:
-                        cfg.add_edge(offset, next_offset)
-            
-            elif opr == "goto":
-                # Unconditional jump
-                target_index = inst.get("target")
-                if target_index is not None:
-                    target_offset = resolve_target(target_index)
-                    if target_offset is not None:
-                        cfg.add_edge(offset, target_offset)
-            
-            elif opr in ("return", "throw"):
-                # Method exits - no successors
-                pass
-            
-            elif opr in ("tableswitch", "lookupswitch"):
-                # Switch statements - default and targets are also indices
-                default_index = inst.get("default")
-                if default_index is not None:
-                    default_offset = resolve_target(default_index)
-                    if default_offset is not None:
-                        cfg.add_edge(offset, default_offset)
-                
-                # Handle targets - can be list of ints or list of dicts
-                for case in inst.get("targets", []):
-                    if isinstance(case, int):
-                        # tableswitch: targets is list of indices
-                        target_offset = resolve_target(case)
-                        if target_offset is not None:
-                            cfg.add_edge(offset, target_offset)
-                    elif isinstance(case, dict):
-                        # lookupswitch: targets is list of {match, target} dicts
-                        target_index = case.get("target")
-                        if target_index is not None:
-                            target_offset = resolve_target(target_index)
-                            if target_offset is not None:
-                                cfg.add_edge(offset, target_offset)
-            
+            tag = tags[i]
+            next_offset = offsets[i + 1] if i < last and tag not in no_fall_through else -1
+            target = targets[i]
+            if target >= 0:
+                succs = (target,) if next_offset < 0 or next_offset == target else (target, next_offset)
+            elif tag in _SWITCH_TAGS:
+                succs = tuple(dict.fromkeys(switch_targets[i]))
             else:
-                # Normal instruction - fall through
-                if i + 1 < len(bytecode):
-                    next_offset = bytecode[i + 1].get("offset")
-                    if next_offset is not None:
-                        cfg.add_edge(offset, next_offset)
+                succs = (next_offset,) if next_offset >= 0 else ()
+            
+            nodes[offset] = CFGNode(offset, inst, succs)
+            pred_lists[offset] = []
+        
+        for offset, node in nodes.items():
+            for succ in node.successors:
+                pred_lists[succ].append(offset)
+        for node, preds in zip(nodes.values(), pred_lists.values()):
+            node.predecessors = tuple(preds)
         
         return cfg
     
-    def extract_calls(self, caller: str, code: dict):
-        """Extract method calls from bytecode."""
+    def extract_calls(
+        self, caller: str, code: dict, parsed: Optional[ParsedBytecode] = None
+    ):
+        """Extract method calls from bytecode (reusing parsed if given)."""
         bytecode = code.get("bytecode", [])
+        if parsed is None:
+            parsed = _preparse(bytecode)
         
-        for inst in bytecode:
-            if inst.get("opr") == "invoke":
-                method_info = inst.get("method", {})
-                ref = method_info.get("ref", {})
-                callee_class = ref.get("name", "")
-                callee_name = method_info.get("name", "")
-                
-                if callee_class and callee_name:
-                    callee = f"{callee_class}.{callee_name}"
-                    self.call_graph.add_call(caller, callee)
+        for callee in _method_callees(bytecode, parsed):
+            self.call_graph.add_call(caller, callee)
     
     def get_entry_points(self, cls: dict, classname: jvm.ClassName) -> Set[str]:
         """Identify entry points - methods that can be called externally."""
@@ -471,14 +750,11 @@ class BytecodeAnalyzer:
         for method in methods:
             method_name = method.get("name", "<unknown>")
             full_name = f"{classname}.{method_name}"
-            access = method.get("access", [])
+            flags = _access_flags(method.get("access", []))
             
-            # Entry points: main, public methods, static initializers, constructors
-            if (method_name == "main" or 
-                "public" in access or 
-                "protected" in access or
-                method_name == "<clinit>" or
-                (method_name == "<init>" and "public" in access)):
+            # Entry points: main, static initializers, and public or protected
+            # methods (which covers public constructors)
+            if flags & (_ACC_PUBLIC | _ACC_PROTECTED) or method_name in _ENTRY_METHOD_NAMES:
                 entry_points.add(full_name)
         
         return entry_points
@@ -488,7 +764,7 @@ class BytecodeAnalyzer:
 # Basic Block
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BasicBlock:
     """
     Basic block in the CFG - maximal sequence of instructions with single entry/exit.
@@ -537,7 +813,8 @@ class CFGBuilder:
     def __init__(
         self,
         bytecode: List[dict],
-        exception_handlers: List[ExceptionHandler] = None
+        exception_handlers: List[ExceptionHandler] = None,
+        parsed: Optional[ParsedBytecode] = None,
     ):
         """
         Initialize CFG builder.
@@ -545,19 +822,20 @@ class CFGBuilder:
         Args:
             bytecode: List of bytecode instruction dicts from jvm2json
             exception_handlers: List of exception handlers for the method
+            parsed: Preparsed view of bytecode, if the caller already has one
         """
         self.bytecode = bytecode
         self.exception_handlers = exception_handlers or []
         
         # Intermediate data structures
-        self._opcodes: Dict[int, Any] = {}  # offset -> parsed opcode
+        self._pcs: Set[int] = set()  # offsets of all instructions
         self._pc_list: List[int] = []  # ordered list of offsets
         self._leaders: Set[int] = set()  # basic block leaders
         self._cfg: Dict[int, CFGNode] = {}  # final CFG (offset -> node)
         self._basic_blocks: List[BasicBlock] = []
-        
-        # Index to offset mapping
-        self._index_to_offset: Dict[int, int] = {}
+        self._parsed: Optional[ParsedBytecode] = parsed  # SoA view of bytecode
+        self._scan_leaders: Set[int] = set()  # jump-induced leaders from _scan_once
+        self._successor_lists: List[List[int]] = []  # index -> normal successor offsets
         
     def build(self) -> Dict[int, CFGNode]:
         """
@@ -569,8 +847,11 @@ class CFGBuilder:
         if not self.bytecode:
             return {}
         
-        # Pass 1: Parse opcodes and build index mapping
-        self._parse_opcodes()
+        # Pass 1: Collect offsets and resolve jump targets
+        if self._parsed is None:
+            self._parsed = _preparse(self.bytecode)
+        self._collect_pcs()
+        self._scan_leaders, self._successor_lists = _scan_once(self._parsed)
         
         # Pass 2: Find leaders (basic block starts)
         self._find_leaders()
@@ -588,29 +869,10 @@ class CFGBuilder:
         """Get the computed basic blocks (after build())."""
         return self._basic_blocks
     
-    def _parse_opcodes(self) -> None:
-        """Parse all bytecode instructions into opcode objects."""
-        for i, instr in enumerate(self.bytecode):
-            offset = instr.get("offset", -1)
-            if offset < 0:
-                continue
-                
-            self._index_to_offset[i] = offset
-            self._pc_list.append(offset)
-            
-            # Try to parse opcode
-            try:
-                opcode = opc.Opcode.from_json(instr)
-            except (NotImplementedError, KeyError):
-                opcode = None
-            
-            self._opcodes[offset] = opcode
-        
-        self._pc_list.sort()
-    
-    def _resolve_target(self, target_index: int) -> Optional[int]:
-        """Convert instruction index to byte offset."""
-        return self._index_to_offset.get(target_index)
+    def _collect_pcs(self) -> None:
+        """Collect the offsets of all instructions, in ascending order."""
+        self._pc_list = sorted(offset for offset in self._parsed.offsets if offset >= 0)
+        self._pcs = set(self._pc_list)
     
     def _find_leaders(self) -> None:
         """
@@ -629,96 +891,37 @@ class CFGBuilder:
         self._leaders.add(self._pc_list[0])
         
         # Find targets and instructions after branches
-        for i, instr in enumerate(self.bytecode):
-            offset = instr.get("offset", -1)
-            if offset < 0:
-                continue
-            
-            opr = instr.get("opr", "")
-            targets = self._get_branch_targets(instr)
-            
-            if targets:
-                # All targets are leaders
-                self._leaders.update(targets)
-                
-                # Instruction after branch is also a leader (for conditional)
-                if opr in ("if", "ifz") and i + 1 < len(self.bytecode):
-                    next_offset = self.bytecode[i + 1].get("offset")
-                    if next_offset is not None:
-                        self._leaders.add(next_offset)
-            
-            # Instructions after gotos/returns/throws are leaders
-            if opr in ("goto", "return", "throw") and i + 1 < len(self.bytecode):
-                next_offset = self.bytecode[i + 1].get("offset")
-                if next_offset is not None:
-                    self._leaders.add(next_offset)
+        self._leaders |= self._scan_leaders
         
         # Exception handler entry points are leaders
         for handler in self.exception_handlers:
-            if handler.handler_pc in self._opcodes or handler.handler_pc in [self._index_to_offset.get(i) for i in range(len(self.bytecode))]:
+            if handler.handler_pc in self._pcs:
                 self._leaders.add(handler.handler_pc)
     
-    def _get_branch_targets(self, instr: dict) -> List[int]:
-        """Get all possible jump targets for an instruction (as byte offsets)."""
-        targets = []
-        opr = instr.get("opr", "")
-        
-        if opr in ("if", "ifz", "goto"):
-            target_index = instr.get("target")
-            if target_index is not None:
-                target_offset = self._resolve_target(target_index)
-                if target_offset is not None:
-                    targets.append(target_offset)
-        
-        elif opr == "tableswitch":
-            default_index = instr.get("default")
-            if default_index is not None:
-                default_offset = self._resolve_target(default_index)
-                if default_offset is not None:
-                    targets.append(default_offset)
-            for case in instr.get("targets", []):
-                if isinstance(case, int):
-                    case_offset = self._resolve_target(case)
-                    if case_offset is not None:
-                        targets.append(case_offset)
-        
-        elif opr == "lookupswitch":
-            default_index = instr.get("default")
-            if default_index is not None:
-                default_offset = self._resolve_target(default_index)
-                if default_offset is not None:
-                    targets.append(default_offset)
-            for case in instr.get("targets", []):
-                if isinstance(case, dict):
-                    target_index = case.get("target")
-                    if target_index is not None:
-                        target_offset = self._resolve_target(target_index)
-                        if target_offset is not None:
-                            targets.append(target_offset)
-        
-        return targets
-    
     def _build_nodes(self) -> None:
         """Build CFG nodes with successor edges."""
+        oprs, offsets = self._parsed.oprs, self._parsed.offsets
+        successor_lists = self._successor_lists
+        covering = self._handlers_by_offset()
+        opr_types = _OPR_MAP
         for i, instr in enumerate(self.bytecode):
-            offset = instr.get("offset", -1)
+            offset = offsets[i]
             if offset < 0:
                 continue
             
-            opcode = self._opcodes.get(offset)
-            opr = instr.get("opr", "")
-            
-            # Classify node type
-            if opcode:
-                node_type = classify_opcode(opcode)
-            else:
-                node_type = classify_opr(opr)
+            # Classify node type. Every opr in _OPR_MAP only parses to opcode
+            # classes of that same NodeType, so the opr string decides; only
+            # other oprs (pop, checkcast, ...) are parsed into an opcode.
+            node_type = opr_types.get(oprs[i])
+            if node_type is None:
+                try:
+                    opcode = opc.Opcode.from_json(instr)
+                except (NotImplementedError, KeyError):
+                    opcode = None
+                node_type = classify_opcode(opcode) if opcode else NodeType.OTHER
             
             # Get exception handlers covering this instruction
-            handlers = [
-                h for h in self.exception_handlers
-                if h.start_pc <= offset < h.end_pc
-            ]
+            handlers = covering.get(offset, ())
             
             # Create node
             node = CFGNode(
@@ -729,89 +932,87 @@ class CFGBuilder:
                 exception_handlers=handlers,
             )
             
-            # Compute successors
-            successors = self._compute_successors(i, instr)
-            node.successors = set(successors)
-            
-            # Add exception handler targets as successors
-            for handler in handlers:
-                node.successors.add(handler.handler_pc)
+            # Normal successors, then exception handler targets
+            node.successors = tuple(dict.fromkeys(
+                [*successor_lists[i], *(handler.handler_pc for handler in handlers)]
+            ))
             
             self._cfg[offset] = node
     
-    def _compute_successors(self, index: int, instr: dict) -> List[int]:
-        """Compute successor byte offsets for an instruction."""
-        opr = instr.get("opr", "")
-        offset = instr.get("offset", -1)
-        successors = []
-        
-        # Return and throw have no successors
-        if opr in ("return", "throw"):
-            return successors
-        
-        # Get next instruction offset
-        next_offset = None
-        if index + 1 < len(self.bytecode):
-            next_offset = self.bytecode[index + 1].get("offset")
-        
-        if opr in ("if", "ifz"):
-            # Conditional: fallthrough + target
-            if next_offset is not None:
-                successors.append(next_offset)
-            target_index = instr.get("target")
-            if target_index is not None:
-                target_offset = self._resolve_target(target_index)
-                if target_offset is not None:
-                    successors.append(target_offset)
-        
-        elif opr == "goto":
-            # Unconditional: only target
-            target_index = instr.get("target")
-            if target_index is not None:
-                target_offset = self._resolve_target(target_index)
-                if target_offset is not None:
-                    successors.append(target_offset)
-        
-        elif opr in ("tableswitch", "lookupswitch"):
-            # Switch: default + all case targets
-            successors.extend(self._get_branch_targets(instr))
-            # Remove duplicates
-            successors = list(dict.fromkeys(successors))
+    def _handlers_by_offset(self) -> Dict[int, Tuple[ExceptionHandler, ...]]:
+        """
+        Map each offset to the handlers whose [start_pc, end_pc) covers it.
         
-        else:
-            # Sequential instruction: fallthrough
-            if next_offset is not None:
-                successors.append(next_offset)
+        Sweeps the sorted _pc_list once, opening handlers at start_pc and
+        closing them at end_pc. Handlers keep their declaration order.
+        """
+        handlers = self.exception_handlers
+        if not handlers:
+            return {}
         
-        return successors
+        by_start = sorted(
+            (j for j, h in enumerate(handlers) if h.start_pc < h.end_pc),
+            key=lambda j: handlers[j].start_pc,
+        )
+        by_end = sorted(by_start, key=lambda j: handlers[j].end_pc)
+        
+        covering: Dict[int, Tuple[ExceptionHandler, ...]] = {}
+        active: Set[int] = set()
+        current: Tuple[ExceptionHandler, ...] = ()
+        si = ei = 0
+        for pc in self._pc_list:
+            changed = False
+            while si < len(by_start) and handlers[by_start[si]].start_pc <= pc:
+                active.add(by_start[si])
+                si += 1
+                changed = True
+            while ei < len(by_end) and handlers[by_end[ei]].end_pc <= pc:
+                active.discard(by_end[ei])
+                ei += 1
+                changed = True
+            if changed:
+                current = tuple(handlers[j] for j in sorted(active))
+            covering[pc] = current
+        return covering
     
     def _compute_predecessors(self) -> None:
         """Compute predecessor edges from successors."""
-        for offset, node in self._cfg.items():
+        cfg = self._cfg
+        pred_lists: Dict[int, List[int]] = {offset: [] for offset in cfg}
+        for offset, node in cfg.items():
             for succ_offset in node.successors:
-                if succ_offset in self._cfg:
-                    self._cfg[succ_offset].predecessors.add(offset)
+                preds = pred_lists.get(succ_offset)
+                if preds is not None:
+                    preds.append(offset)
+        for offset, preds in pred_lists.items():
+            cfg[offset].predecessors = tuple(preds)
     
     def _build_basic_blocks(self) -> None:
         """Build basic blocks from leaders."""
         sorted_leaders = sorted(self._leaders)
+        pc_list = self._pc_list
+        cfg = self._cfg
+        num_pcs = len(pc_list)
+        # Bound for the last block: one past the highest pc
+        end_pc = pc_list[-1] + 1 if pc_list else 0
         
+        # Merge walk: both lists are sorted, so each block's pcs are the
+        # next run of pc_list below the following leader
         block_id = 0
+        pi = 0
         for i, leader_pc in enumerate(sorted_leaders):
-            # Find end of this block
-            if i + 1 < len(sorted_leaders):
-                next_leader = sorted_leaders[i + 1]
-            else:
-                next_leader = float('inf')
+            next_leader = sorted_leaders[i + 1] if i + 1 < len(sorted_leaders) else end_pc
+            
+            while pi < num_pcs and pc_list[pi] < leader_pc:
+                pi += 1
+            start = pi
+            while pi < num_pcs and pc_list[pi] < next_leader:
+                pi += 1
             
             # Collect nodes in this block
-            block_nodes = []
-            for pc in self._pc_list:
-                if pc >= leader_pc and pc < next_leader:
-                    if pc in self._cfg:
-                        node = self._cfg[pc]
-                        node.basic_block_id = block_id
-                        block_nodes.append(node)
+            block_nodes = [cfg[pc] for pc in pc_list[start:pi] if pc in cfg]
+            for node in block_nodes:
+                node.basic_block_id = block_id
             
             if block_nodes:
                 block = BasicBlock(
@@ -833,13 +1034,14 @@ class CFGBuilder:
                         if succ_block_id is not None and succ_block_id not in block.successor_blocks:
                             block.successor_blocks.append(succ_block_id)
         
-        # Compute predecessor blocks
+        # Compute predecessor blocks. Block ids are dense (0..B-1), so
+        # _basic_blocks doubles as the id -> block map.
+        pred_sets: List[Set[int]] = [set() for _ in self._basic_blocks]
         for block in self._basic_blocks:
             for succ_id in block.successor_blocks:
-                for other in self._basic_blocks:
-                    if other.block_id == succ_id:
-                        if block.block_id not in other.predecessor_blocks:
-                            other.predecessor_blocks.append(block.block_id)
+                pred_sets[succ_id].add(block.block_id)
+        for block, preds in zip(self._basic_blocks, pred_sets):
+            block.predecessor_blocks = sorted(preds)
 
 
 def build_cfg_from_json(method_json: dict) -> tuple:
@@ -856,16 +1058,14 @@ def build_cfg_from_json(method_json: dict) -> tuple:
     bytecode = code.get("bytecode", [])
     exceptions = code.get("exceptions", [])
     
-    # Build index to offset mapping first
-    index_to_offset = {}
-    for i, inst in enumerate(bytecode):
-        offset = inst.get("offset", -1)
-        if offset >= 0:
-            index_to_offset[i] = offset
+    # Handler ranges are instruction indices; translate them through the
+    # preparsed offsets array, which the builder then reuses
+    parsed = _preparse(bytecode)
+    index_to_offset = {i: offset for i, offset in enumerate(parsed.offsets) if offset >= 0}
     
     handlers = [ExceptionHandler.from_json(e, index_to_offset) for e in exceptions]
     
-    builder = CFGBuilder(bytecode, handlers)
+    builder = CFGBuilder(bytecode, handlers, parsed)
     cfg = builder.build()
     blocks = builder.get_basic_blocks()
     
@@ -27,7 +27,10 @@ from solutions.ir import (
     MethodIR, ExceptionHandler,
     NodeType, StatementType
 )
-from solutions.components.bytecode_analysis import CFGBuilder, classify_opcode, build_cfg_from_json
+from solutions.components.bytecode_analysis import (
+    BytecodeAnalyzer, CallGraph, CFGBuilder, classify_opcode, classify_opr,
+    build_cfg_from_json,
+)
 from solutions.statement_grouper import StatementGrouper, group_statements
 from solutions.syntaxer import (
     SourceParser, UnifiedAnalyzer
@@ -790,6 +793,22 @@ class TestNodeTypeClassification:
         node_type = classify_opcode(ret)
         
         assert node_type == NodeType.RETURN
+    
+    def test_opr_agrees_with_opcode(self, suite):
+        """Classifying by opr string matches classifying the parsed opcode."""
+        from jpamb.jvm.opcode import Opcode
+        
+        for name in ("Simple", "Debloating", "Arrays"):
+            cls = suite.findclass(jvm.ClassName(f"jpamb/cases/{name}"))
+            for method in cls["methods"]:
+                for instr in (method.get("code") or {}).get("bytecode", []):
+                    if classify_opr(instr["opr"]) == NodeType.OTHER:
+                        continue
+                    try:
+                        opcode = Opcode.from_json(instr)
+                    except (NotImplementedError, KeyError):
+                        continue
+                    assert classify_opcode(opcode) == classify_opr(instr["opr"])
 
 
 # ============================================================================
@@ -845,6 +864,95 @@ class TestExceptionHandlers:
         pass
 
 
+# ============================================================================
+# Bytecode Analyzer Tests
+# ============================================================================
+
+# goto at index 1 jumps to index 3 (offset 5), skipping the push at offset 4
+GOTO_OVER_PUSH = [
+    {"offset": 0, "opr": "push"},
+    {"offset": 1, "opr": "goto", "target": 3},
+    {"offset": 4, "opr": "push"},
+    {"offset": 5, "opr": "return"},
+]
+
+
+class TestBytecodeAnalyzer:
+    """Tests for the dead-code CFG and call graph analysis."""
+    
+    def test_unreachable_after_goto(self, suite):
+        """Instructions jumped over by a goto are unreachable."""
+        cfg = BytecodeAnalyzer(suite).build_cfg("M.m", {"bytecode": GOTO_OVER_PUSH})
+        
+        assert cfg.get_reachable_nodes() == {0, 1, 5}
+        assert cfg.get_unreachable_nodes() == {4}
+    
+    def test_reachability_sees_added_edges(self, suite):
+        """Edges added after construction are taken into account."""
+        cfg = BytecodeAnalyzer(suite).build_cfg("M.m", {"bytecode": GOTO_OVER_PUSH})
+        
+        cfg.add_edge(1, 4)
+        
+        assert cfg.get_unreachable_nodes() == set()
+    
+    def test_reachability_follows_node_tuples(self, suite):
+        """Reassigning a node's successors changes reachability."""
+        cfg = BytecodeAnalyzer(suite).build_cfg("M.m", {"bytecode": GOTO_OVER_PUSH})
+        
+        cfg.nodes[1].successors = (4,)
+        
+        assert cfg.nodes[1].successors == (4,)
+        assert cfg.get_unreachable_nodes() == set()
+    
+    def test_call_graph_through_cycle(self):
+        """Reachability follows calls through mutually recursive methods."""
+        graph = CallGraph()
+        graph.add_call("main", "even")
+        graph.add_call("even", "odd")
+        graph.add_call("odd", "even")
+        graph.add_call("odd", "leaf")
+        graph.add_method("unused")
+        
+        assert graph.get_reachable_from({"main"}) == {"main", "even", "odd", "leaf"}
+        assert graph.get_reachable_from({"odd", "extern"}) == {"even", "odd", "leaf", "extern"}
+        
+        graph.add_call("leaf", "unused")
+        assert "unused" in graph.get_reachable_from({"main"})
+    
+    def test_analyze_class_dead_code(self, suite):
+        """Analyzing Debloating finds dead instructions and unreachable methods."""
+        classname = jvm.ClassName("jpamb/cases/Debloating")
+        result = BytecodeAnalyzer(suite).analyze_class(classname)
+        
+        assert result.total_instructions > 0
+        assert result.get_dead_instruction_count() > 0
+        assert result.unreachable_methods
+        assert not (set(result.cfgs) & result.unreachable_methods)
+        for method_name, dead in result.dead_instructions.items():
+            assert dead <= set(result.cfgs[method_name].nodes)
+            assert not (dead & result.cfgs[method_name].get_reachable_nodes())
+    
+    def test_analyze_class_isolated_and_cached(self, suite):
+        """Each class gets its own CFGs, and re-analysis returns a copy of the cached result."""
+        analyzer = BytecodeAnalyzer(suite)
+        debloating_name = jvm.ClassName("jpamb/cases/Debloating")
+        debloating = analyzer.analyze_class(debloating_name)
+        expected = {m: set(offsets) for m, offsets in debloating.dead_instructions.items()}
+        simple = analyzer.analyze_class(jvm.ClassName("jpamb/cases/Simple"))
+        
+        assert all(name.startswith("jpamb/cases/Simple.") for name in simple.cfgs)
+        
+        # Callers such as the debloater extend the dead sets in place
+        for offsets in debloating.dead_instructions.values():
+            offsets.add(-1)
+        
+        again = analyzer.analyze_class(debloating_name)
+        assert again is not debloating
+        assert again.dead_instructions == expected
+        assert analyzer.cfgs.keys() == debloating.cfgs.keys()
+        assert analyzer.call_graph is debloating.call_graph
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -0,0 +1,257 @@
+"""
+Tests for the javap parsing in verify_abstract_interpreter.py.
+
+The parser only consumes text, so canned javap transcripts stand in for a
+JDK install:
+- Method boundaries, with and without a LineNumberTable
+- Exception tables and switch case rows inside a method body
+- Splitting javap -sysinfo output into one section per class
+- parse_javap_batch's cache and per-class fallback
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import verify_abstract_interpreter as vai  # noqa: E402
+
+
+SAMPLE_CLASS = """\
+Compiled from "Sample.java"
+public class jpamb.cases.Sample {
+  public jpamb.cases.Sample();
+    Code:
+       0: aload_0
+       1: invokespecial #1                  // Method java/lang/Object."<init>":()V
+       4: return
+    LineNumberTable:
+      line 3: 0
+
+  public static int noLines(int);
+    Code:
+       0: iload_0
+       1: ifle          6
+       4: iconst_1
+       5: ireturn
+       6: iconst_0
+       7: ireturn
+
+  public static int divide(int, int);
+    Code:
+       0: iload_0
+       1: iload_1
+       2: idiv
+       3: ireturn
+       4: astore_2
+       5: iconst_0
+       6: ireturn
+    Exception table:
+       from    to  target type
+           0     3     4   Class java/lang/ArithmeticException
+    LineNumberTable:
+      line 10: 0
+      line 11: 4
+      line 12: 5
+
+  public static int choose(int);
+    Code:
+       0: iload_0
+       1: tableswitch   { // 0 to 1
+                     0: 24
+                     1: 26
+               default: 28
+          }
+      24: iconst_1
+      25: ireturn
+      26: iconst_2
+      27: ireturn
+      28: iconst_0
+      29: ireturn
+    LineNumberTable:
+      line 20: 0
+      line 21: 24
+      line 22: 26
+      line 23: 28
+}
+"""
+
+OTHER_CLASS = """\
+Compiled from "Other.java"
+public class jpamb.cases.Other {
+  public static void run();
+    Code:
+       0: goto          0
+    LineNumberTable:
+      line 5: 0
+}
+"""
+
+
+def sysinfo_output(*classes):
+    """javap -sysinfo transcript: each (path, body) pair under its Classfile header."""
+    return "".join(
+        f"Classfile {path}\n  Last modified Jan 1, 2025; size 512 bytes\n{body}"
+        for path, body in classes
+    )
+
+
+class TestParseJavapOutput:
+    """Tests for parse_javap_output on a canned javap -c -l transcript."""
+    
+    @pytest.fixture
+    def methods(self):
+        return vai.parse_javap_output(SAMPLE_CLASS)
+    
+    def test_finds_static_methods(self, methods):
+        """Every static method is found; the constructor is not one of them."""
+        assert list(methods) == ['noLines', 'divide', 'choose']
+    
+    def test_method_without_line_table(self, methods):
+        """A body ended by a blank line does not hide the method after it."""
+        method = methods['noLines']
+        
+        assert method.bytecode == [
+            (0, 'iload_0', None), (1, 'ifle', 6), (4, 'iconst_1', None),
+            (5, 'ireturn', None), (6, 'iconst_0', None), (7, 'ireturn', None),
+        ]
+        assert method.line_table == {}
+        assert method.offset_to_line == {}
+    
+    def test_exception_table_is_skipped(self, methods):
+        """Exception table rows are not instructions, and the line table after them is read."""
+        method = methods['divide']
+        
+        assert [offset for offset, _, _ in method.bytecode] == [0, 1, 2, 3, 4, 5, 6]
+        assert method.line_table == {10: 0, 11: 4, 12: 5}
+        assert method.offset_to_line == {0: 10, 1: 10, 2: 10, 3: 10, 4: 11, 5: 12, 6: 12}
+    
+    def test_switch_case_rows_are_skipped(self, methods):
+        """Case rows ("<key>: <target>") of a tableswitch are not instructions."""
+        method = methods['choose']
+        
+        assert method.bytecode == [
+            (0, 'iload_0', None), (1, 'tableswitch', None),
+            (24, 'iconst_1', None), (25, 'ireturn', None),
+            (26, 'iconst_2', None), (27, 'ireturn', None),
+            (28, 'iconst_0', None), (29, 'ireturn', None),
+        ]
+        assert method.offset_to_line == {
+            0: 20, 1: 20, 24: 21, 25: 21, 26: 22, 27: 22, 28: 23, 29: 23,
+        }
+    
+    def test_next_header_without_blank_line(self):
+        """A method header directly after a body is left for the next method."""
+        output = (
+            "  public static void first();\n"
+            "    Code:\n"
+            "       0: return\n"
+            "  public static void second();\n"
+            "    Code:\n"
+            "       0: return\n"
+            "    LineNumberTable:\n"
+            "      line 7: 0\n"
+        )
+        
+        methods = vai.parse_javap_output(output)
+        
+        assert list(methods) == ['first', 'second']
+        assert methods['first'].bytecode == [(0, 'return', None)]
+        assert methods['second'].offset_to_line == {0: 7}
+
+
+class TestClassfileSections:
+    """Tests for splitting javap -sysinfo output by class."""
+    
+    def test_two_sections(self):
+        """Each Classfile header starts a section holding only that class's lines."""
+        output = sysinfo_output(('/x/Sample.class', SAMPLE_CLASS), ('/x/Other.class', OTHER_CLASS))
+        
+        parsed = [
+            vai._parse_javap_stream(section)
+            for section in vai._classfile_sections(io.StringIO(output))
+        ]
+        
+        assert [list(methods) for methods in parsed] == [['noLines', 'divide', 'choose'], ['run']]
+        assert parsed[1]['run'].bytecode == [(0, 'goto', 0)]
+    
+    def test_text_before_first_header_is_dropped(self):
+        """Lines before the first Classfile header belong to no section."""
+        output = "Warning: something\n" + sysinfo_output(('/x/Other.class', OTHER_CLASS))
+        
+        sections = [list(section) for section in vai._classfile_sections(io.StringIO(output))]
+        
+        assert len(sections) == 1
+        assert sections[0][0].startswith('  Last modified')
+
+
+class FakePopen:
+    """Stands in for subprocess.Popen running javap on the class files in `outputs`."""
+    
+    outputs = {}
+    calls = []
+    
+    def __init__(self, args, **kwargs):
+        files = [arg for arg in args if arg.endswith('.class')]
+        FakePopen.calls.append(files)
+        known = [f for f in files if f in self.outputs]
+        if '-sysinfo' in args:
+            self.stdout = io.StringIO(sysinfo_output(*((f, self.outputs[f]) for f in known)))
+        else:
+            self.stdout = io.StringIO("".join(self.outputs[f] for f in known))
+        self.returncode = 0 if len(known) == len(files) else 1
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def communicate(self):
+        return '', 'Error: class not found'
+
+
+class TestParseJavapBatch:
+    """Tests for parse_javap_batch with javap replaced by FakePopen."""
+    
+    @pytest.fixture
+    def class_files(self, tmp_path, monkeypatch):
+        sample = tmp_path / 'Sample.class'
+        other = tmp_path / 'Other.class'
+        sample.write_bytes(b'\xca\xfe')
+        other.write_bytes(b'\xca\xfe')
+        
+        monkeypatch.setattr(vai, '_CACHE_DIR', tmp_path / 'cache')
+        monkeypatch.setattr(vai.subprocess, 'Popen', FakePopen)
+        monkeypatch.setattr(FakePopen, 'outputs', {str(sample): SAMPLE_CLASS, str(other): OTHER_CLASS})
+        monkeypatch.setattr(FakePopen, 'calls', [])
+        return sample, other
+    
+    def test_one_javap_run_then_cache(self, class_files):
+        """All classes go through one javap run; a second call is served from the cache."""
+        sample, other = class_files
+        
+        first = vai.parse_javap_batch([sample, other])
+        second = vai.parse_javap_batch([sample, other])
+        
+        assert FakePopen.calls == [[str(sample), str(other)]]
+        assert list(first[sample]) == ['noLines', 'divide', 'choose']
+        assert list(first[other]) == ['run']
+        assert second == first
+    
+    def test_fallback_runs_javap_per_class(self, class_files, capsys):
+        """If the batch run fails, each class is disassembled on its own."""
+        sample, other = class_files
+        missing = sample.parent / 'Missing.class'
+        
+        results = vai.parse_javap_batch([sample, missing, other])
+        
+        assert FakePopen.calls[1:] == [[str(sample)], [str(missing)], [str(missing)], [str(other)]]
+        assert list(results[sample]) == ['noLines', 'divide', 'choose']
+        assert list(results[other]) == ['run']
+        assert results[missing] == {}
+        assert f"javap failed for {missing}" in capsys.readouterr().err
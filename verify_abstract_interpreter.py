@@ -6,11 +6,65 @@ This script parses javap output to get the correct bytecode structure,
 then compares with the abstract interpreter's dead code detection.
 """
 
+import functools
+import hashlib
+import io
+import pickle
 import subprocess
+import sys
 import re
+from bisect import bisect_right
+from collections import deque
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple, Optional
+
+import jpamb
+from jpamb import jvm
+
+# numpy ships with the optional "stats" extra; without it line mapping stays pure Python
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# The abstract interpreter is imported as components.* from the solutions dir
+SOLUTIONS_DIR = Path(__file__).parent / 'solutions'
+if str(SOLUTIONS_DIR) not in sys.path:
+    sys.path.insert(0, str(SOLUTIONS_DIR))
+
+from components.abstract_interpreter import product_unbounded_run  # noqa: E402
+
+
+# Patterns used by parse_javap_output, compiled once at import time
+_METHOD_RE = re.compile(r'\s+public static \w+ (\w+)\(')
+_LN_RE = re.compile(r'line (\d+): (\d+)')
+_CLASSFILE_RE = re.compile(r'^Classfile ', re.M)
+# Prefixes checked with a single str.startswith(tuple) call
+_MODIFIERS = ('public ', 'private ', 'protected ', 'static ')
+_OTHER_TABLES = ('LocalVariableTable:', 'StackMapTable:')
+_NEXT_METHOD_RE = re.compile(r'^\s*(public|private|protected|static|final|abstract|\w+\s+\w+\s*\()')
+_JUMP_TARGET_RE = re.compile(r'\b(\d+)\b')
+
+# Compiled classes, as a posix path prefix
+_CLASSES_PREFIX = 'target/classes/'
+
+# Parsed javap results, one file per class, next to this script
+_CACHE_DIR = Path(__file__).parent / '.javap_cache'
+# Digest of this file; cached parses from any other version of the parser are ignored
+_PARSER_DIGEST = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+# Instructions whose operand is a branch target offset
+JUMP_OPCODES = frozenset({
+    'if_icmple', 'if_icmpge', 'if_icmplt', 'if_icmpgt',
+    'if_icmpeq', 'if_icmpne', 'ifle', 'ifge', 'iflt',
+    'ifgt', 'ifeq', 'ifne', 'ifnull', 'ifnonnull',
+    'goto', 'goto_w',
+})
+
+# Instructions followed by a "{ ... }" block of "<key>: <target>" case rows
+SWITCH_OPCODES = frozenset({'tableswitch', 'lookupswitch'})
 
 
 @dataclass
@@ -21,105 +75,354 @@ class JavapMethod:
     line_table: Dict[int, int]  # line -> offset
     offset_to_line: Dict[int, int]  # offset -> line (computed)
     
-    def get_all_offsets(self) -> Set[int]:
-        return {offset for offset, _, _ in self.bytecode}
+    # Lookup tables derived from bytecode/line_table in __post_init__
+    _all_offsets: FrozenSet[int] = field(init=False, repr=False, compare=False)
+    _all_offsets_sorted: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _sorted_line_offsets: List[int] = field(init=False, repr=False, compare=False)
+    _sorted_line_numbers: List[int] = field(init=False, repr=False, compare=False)
+    # NumPy copies of the sorted line table, built on first vectorised lookup
+    _lt_offsets: Any = field(init=False, repr=False, compare=False, default=None)
+    _lt_lines: Any = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self):
+        self._all_offsets = frozenset(offset for offset, _, _ in self.bytecode)
+        self._all_offsets_sorted = tuple(sorted(self._all_offsets))
+        
+        # (offset, line) pairs ordered by offset; the first line listed for an
+        # offset wins, matching the linear scan this replaces
+        self._sorted_line_offsets = []
+        self._sorted_line_numbers = []
+        for line, line_offset in sorted(self.line_table.items(), key=lambda x: x[1]):
+            if self._sorted_line_offsets and self._sorted_line_offsets[-1] == line_offset:
+                continue
+            self._sorted_line_offsets.append(line_offset)
+            self._sorted_line_numbers.append(line)
+    
+    def get_all_offsets(self) -> FrozenSet[int]:
+        return self._all_offsets
+    
+    def get_sorted_offsets(self) -> Tuple[int, ...]:
+        return self._all_offsets_sorted
     
     def get_line_for_offset(self, offset: int) -> Optional[int]:
         """Find the source line for a bytecode offset."""
         # Find the largest line table entry <= offset
-        best_line = None
-        best_offset = -1
-        for line, line_offset in self.line_table.items():
-            if line_offset <= offset and line_offset > best_offset:
-                best_line = line
-                best_offset = line_offset
-        return best_line
+        idx = bisect_right(self._sorted_line_offsets, offset)
+        if idx == 0:
+            return None
+        return self._sorted_line_numbers[idx - 1]
+    
+    def lines_for_offsets_np(self, offsets: Iterable[int]) -> Any:
+        """
+        Vectorised get_line_for_offset over many offsets at once.
+        
+        Returns an int32 array with the source line of each offset, or -1
+        where the offset precedes the first line table entry. Needs numpy.
+        """
+        if self._lt_offsets is None:
+            self._lt_offsets = np.array(self._sorted_line_offsets, dtype=np.int32)
+            self._lt_lines = np.array(self._sorted_line_numbers, dtype=np.int32)
+        
+        offsets = np.asarray(offsets, dtype=np.int32)
+        if not len(self._lt_offsets):
+            return np.full(offsets.shape, -1, dtype=np.int32)
+        idx = np.searchsorted(self._lt_offsets, offsets, side='right') - 1
+        return np.where(idx >= 0, self._lt_lines[idx], -1)
+    
+    def lines_for_offsets(self, offsets_sorted: Iterable[int]) -> Dict[int, List[int]]:
+        """
+        Group ascending bytecode offsets by source line.
+        
+        Walks the offsets and the line starts together in a single pass;
+        offsets before the first line table entry are left out. Used instead
+        of lines_for_offsets_np when numpy is not installed.
+        """
+        starts = self._sorted_line_offsets
+        line_numbers = self._sorted_line_numbers
+        n = len(starts)
+        by_line: Dict[int, List[int]] = {}
+        j = -1  # index of the line start covering the current offset
+        for offset in offsets_sorted:
+            while j + 1 < n and starts[j + 1] <= offset:
+                j += 1
+            if j >= 0:
+                by_line.setdefault(line_numbers[j], []).append(offset)
+        return by_line
 
 
-def parse_javap_output(javap_output: str) -> Dict[str, JavapMethod]:
-    """Parse javap -c -l output into structured data."""
-    methods = {}
+class _LineReader:
+    """Line iterator with a one-slot lookahead, used to stream javap output."""
     
-    lines = javap_output.split('\n')
-    i = 0
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._pending: deque = deque(maxlen=1)
     
-    while i < len(lines):
-        line = lines[i]
-        
+    def __iter__(self) -> Iterator[str]:
+        return self
+    
+    def __next__(self) -> str:
+        if self._pending:
+            return self._pending.popleft()
+        return next(self._lines)
+    
+    def push_back(self, line: str) -> None:
+        """Return a line so the next read yields it again."""
+        self._pending.append(line)
+
+
+def _parse_javap_stream(lines: Iterable[str]) -> Dict[str, JavapMethod]:
+    """Parse javap -c -l output, consuming it one line at a time."""
+    methods = {}
+    reader = _LineReader(lines)
+    
+    for line in reader:
         # Look for method signature
-        method_match = re.match(r'\s+public static \w+ (\w+)\(', line)
-        if method_match:
-            method_name = method_match.group(1)
-            bytecode = []
-            line_table = {}
+        method_match = _METHOD_RE.match(line)
+        if not method_match:
+            continue
+        
+        method_name = method_match.group(1)
+        bytecode = []
+        line_table = {}
+        
+        # Skip to Code:
+        for line in reader:
+            if 'Code:' in line:
+                break
+        
+        # Parse bytecode
+        for line in reader:
+            bc_line = line.strip()
             
-            i += 1
-            # Skip to Code:
-            while i < len(lines) and 'Code:' not in lines[i]:
-                i += 1
-            i += 1
+            if bc_line.startswith('LineNumberTable:'):
+                # Parse line number table
+                for line in reader:
+                    ln_match = _LN_RE.match(line.strip())
+                    if not ln_match:
+                        break
+                    line_num = int(ln_match.group(1))
+                    offset = int(ln_match.group(2))
+                    line_table[line_num] = offset
+                break
             
-            # Parse bytecode
-            while i < len(lines):
-                bc_line = lines[i].strip()
+            # Parse bytecode instruction ("<offset>: <opcode> [operands]")
+            head, sep, rest = bc_line.partition(':')
+            parts = rest.split(None, 1) if sep and head.isdigit() else None
+            if parts:
+                offset = int(head)
+                instr = parts[0]
+                operands = parts[1] if len(parts) > 1 else ''
                 
-                if bc_line.startswith('LineNumberTable:'):
-                    i += 1
-                    # Parse line number table
-                    while i < len(lines):
-                        ln_line = lines[i].strip()
-                        ln_match = re.match(r'line (\d+): (\d+)', ln_line)
-                        if ln_match:
-                            line_num = int(ln_match.group(1))
-                            offset = int(ln_match.group(2))
-                            line_table[line_num] = offset
-                            i += 1
-                        else:
-                            break
-                    break
+                # Extract jump target if present; javap prints it as the
+                # first operand, so only fall back to a regex if that fails
+                jump_target = None
+                if instr in JUMP_OPCODES and operands:
+                    try:
+                        jump_target = int(operands.split(None, 1)[0].rstrip(','))
+                    except ValueError:
+                        target_match = _JUMP_TARGET_RE.search(operands)
+                        if target_match:
+                            jump_target = int(target_match.group(1))
                 
-                # Parse bytecode instruction
-                bc_match = re.match(r'(\d+): (\w+)', bc_line)
-                if bc_match:
-                    offset = int(bc_match.group(1))
-                    instr = bc_match.group(2)
-                    
-                    # Extract jump target if present
-                    jump_target = None
-                    target_match = re.search(r'\s+(\d+)(?:\s|$)', bc_line)
-                    if target_match and instr in ('if_icmple', 'if_icmpge', 'if_icmplt', 'if_icmpgt',
-                                                    'if_icmpeq', 'if_icmpne', 'ifle', 'ifge', 'iflt',
-                                                    'ifgt', 'ifeq', 'ifne', 'ifnull', 'ifnonnull',
-                                                    'goto', 'goto_w'):
-                        jump_target = int(target_match.group(1))
-                    
-                    bytecode.append((offset, instr, jump_target))
+                bytecode.append((offset, instr, jump_target))
                 
-                i += 1
-                if not bc_line or bc_line.startswith('public') or bc_line.startswith('static'):
-                    break
-            
-            # Compute offset_to_line mapping
-            offset_to_line = {}
-            sorted_lines = sorted(line_table.items(), key=lambda x: x[1])
-            for offset, _, _ in bytecode:
-                for line, line_offset in reversed(sorted_lines):
-                    if line_offset <= offset:
-                        offset_to_line[offset] = line
-                        break
+                # Case rows look like instructions, so skip to the closing brace
+                if instr in SWITCH_OPCODES:
+                    for line in reader:
+                        if line.strip() == '}':
+                            break
             
-            methods[method_name] = JavapMethod(
-                name=method_name,
-                bytecode=bytecode,
-                line_table=line_table,
-                offset_to_line=offset_to_line
-            )
+            elif not bc_line or bc_line.startswith(_OTHER_TABLES):
+                break
+            elif bc_line.startswith(_MODIFIERS) or _NEXT_METHOD_RE.match(line):
+                # Next method's header; leave it for the outer loop
+                reader.push_back(line)
+                break
+        
+        # Compute offset_to_line mapping: each offset takes the line of the
+        # closest line table entry at or before it (the last listed wins ties)
+        line_starts = []
+        line_nums = []
+        for line_num, line_offset in sorted(line_table.items(), key=lambda x: x[1]):
+            if line_starts and line_starts[-1] == line_offset:
+                line_nums[-1] = line_num
+            else:
+                line_starts.append(line_offset)
+                line_nums.append(line_num)
+        offset_to_line = {}
+        for offset, _, _ in bytecode:
+            idx = bisect_right(line_starts, offset)
+            if idx:
+                offset_to_line[offset] = line_nums[idx - 1]
         
-        i += 1
+        methods[method_name] = JavapMethod(
+            name=method_name,
+            bytecode=bytecode,
+            line_table=line_table,
+            offset_to_line=offset_to_line
+        )
     
     return methods
 
 
+def parse_javap_output(javap_output: str) -> Dict[str, JavapMethod]:
+    """Parse javap -c -l output into structured data."""
+    return _parse_javap_stream(io.StringIO(javap_output))
+
+
+def _classfile_sections(lines: Iterable[str]) -> Iterator[Iterator[str]]:
+    """
+    Split javap -sysinfo output into one line iterator per class.
+    
+    Each section must be fully consumed before requesting the next one.
+    """
+    reader = _LineReader(lines)
+    
+    def section() -> Iterator[str]:
+        for line in reader:
+            if _CLASSFILE_RE.match(line):
+                reader.push_back(line)
+                return
+            yield line
+    
+    for line in reader:
+        if _CLASSFILE_RE.match(line):
+            yield section()
+
+
+# (cache file, stamp): the stamp is stored with the entry and must match to reuse it
+_CacheEntry = Tuple[Path, Tuple[str, int, int]]
+
+
+def _javap_cache_entry(class_file: Path) -> Optional[_CacheEntry]:
+    """
+    Cache file and stamp for a class file.
+    
+    The file is named after the class file's path only, so recompiling a
+    class overwrites its old entry; the stamp (parser digest, mtime and size)
+    is kept inside it. Returns None if the file cannot be stat'ed (e.g. it
+    does not exist); that is treated as a cache miss, and javap reports the
+    actual problem.
+    """
+    try:
+        stat = class_file.stat()
+    except OSError:
+        return None
+    key = hashlib.sha1(str(class_file.resolve()).encode()).hexdigest()
+    return _CACHE_DIR / f"{key}.pkl", (_PARSER_DIGEST, stat.st_mtime_ns, stat.st_size)
+
+
+def _load_cached(entry: Optional[_CacheEntry]) -> Optional[Dict[str, JavapMethod]]:
+    if entry is None or not entry[0].exists():
+        return None
+    cache_file, stamp = entry
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, methods = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+        return None  # Corrupt entry, caller regenerates it
+    return methods if cached_stamp == stamp else None
+
+
+def _store_cached(entry: Optional[_CacheEntry], methods: Dict[str, JavapMethod]) -> None:
+    if entry is None:
+        return
+    cache_file, stamp = entry
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((stamp, methods), f)
+    except OSError:
+        pass  # Caching is best effort
+
+
+def _report_javap_error(class_file: Path) -> None:
+    """Re-run a failed javap with stderr captured, only to show why it failed."""
+    with subprocess.Popen(
+        ['javap', '-c', '-l', str(class_file)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    ) as proc:
+        _, stderr = proc.communicate()
+    print(f"javap failed for {class_file}: {stderr.strip()}", file=sys.stderr)
+
+
+def _run_javap(class_files: List[Path]) -> Optional[List[Dict[str, JavapMethod]]]:
+    """
+    Run a single javap process over all class files, parsing as it streams.
+    
+    Returns the parsed methods per class file (in argument order), or None if
+    javap failed and the combined output cannot be attributed reliably.
+    """
+    # -sysinfo makes javap start every class with a "Classfile <path>" header.
+    # stderr is discarded so it cannot fill up while stdout is being read.
+    with subprocess.Popen(
+        ['javap', '-c', '-l', '-sysinfo', *map(str, class_files)],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+    ) as proc:
+        parsed = [_parse_javap_stream(section) for section in _classfile_sections(proc.stdout)]
+    
+    if proc.returncode != 0 or len(parsed) != len(class_files):
+        return None
+    return parsed
+
+
+def parse_javap_batch(class_files: List[Path]) -> Dict[Path, Dict[str, JavapMethod]]:
+    """
+    Run javap on several class files and parse the output of each.
+    
+    Class files without a valid cache entry are disassembled by one javap
+    invocation, so the JVM start-up cost is paid once instead of per class.
+    Results are cached on disk, one entry per class; an entry is only reused
+    if the class file's mtime and size and the parser itself are unchanged.
+    """
+    results: Dict[Path, Dict[str, JavapMethod]] = {}
+    missing: List[Tuple[Path, Optional[_CacheEntry]]] = []  # (class_file, cache entry)
+    
+    for class_file in map(Path, class_files):
+        entry = _javap_cache_entry(class_file)
+        cached = _load_cached(entry)
+        if cached is not None:
+            results[class_file] = cached
+        else:
+            missing.append((class_file, entry))
+    
+    if not missing:
+        return results
+    
+    parsed = _run_javap([class_file for class_file, _ in missing])
+    if parsed is not None:
+        for (class_file, entry), methods in zip(missing, parsed):
+            _store_cached(entry, methods)
+            results[class_file] = methods
+    else:
+        # Fall back to one javap per class so a single bad file does not
+        # prevent the others from being parsed
+        for class_file, entry in missing:
+            with subprocess.Popen(
+                ['javap', '-c', '-l', str(class_file)],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+            ) as proc:
+                methods = _parse_javap_stream(proc.stdout)
+            if proc.returncode == 0:
+                _store_cached(entry, methods)
+            else:
+                _report_javap_error(class_file)
+            results[class_file] = methods
+    
+    return results
+
+
+def parse_javap(class_file: Path) -> Dict[str, JavapMethod]:
+    """Run javap on a class file and parse its output (see parse_javap_batch)."""
+    class_file = Path(class_file)
+    return parse_javap_batch([class_file])[class_file]
+
+
+def class_file_to_name(class_file: Path) -> str:
+    """'target/classes/a/b/C.class' -> 'a/b/C' (the form jvm.ClassName takes)."""
+    return Path(class_file).as_posix().removeprefix(_CLASSES_PREFIX).removesuffix('.class')
+
+
 def analyze_dead_code_ground_truth(method: JavapMethod) -> Dict[str, Set[int]]:
     """
     Analyze dead code using javap bytecode as ground truth.
@@ -129,7 +432,7 @@ def analyze_dead_code_ground_truth(method: JavapMethod) -> Dict[str, Set[int]]:
     """
     # Build control flow
     offsets = method.get_all_offsets()
-    offset_list = sorted(offsets)
+    offset_list = method.get_sorted_offsets()
     
     # For each conditional branch, identify the dead branch based on the condition
     # This is a simplified analysis - the real abstract interpreter does more
@@ -151,13 +454,37 @@ def analyze_dead_code_ground_truth(method: JavapMethod) -> Dict[str, Set[int]]:
     return result
 
 
+def _offsets_to_bits(offsets: Iterable[int]) -> int:
+    """Pack bytecode offsets into an int bitset (bit n set <=> offset n present)."""
+    bits = 0
+    for pc in offsets:
+        bits |= 1 << pc
+    return bits
+
+
+def _bits_to_offsets(bits: int) -> List[int]:
+    """Unpack an int bitset into its offsets, in ascending order."""
+    offsets = []
+    while bits:
+        low = bits & -bits
+        offsets.append(low.bit_length() - 1)
+        bits ^= low
+    return offsets
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_product_run(suite, abs_method) -> int:
+    """Run the product-domain interpreter once per method; visited PCs as a bitset."""
+    _, visited_pcs = product_unbounded_run(suite, abs_method)
+    return _offsets_to_bits(visited_pcs)
+
+
 def run_abstract_interpreter_on_method(suite, classname, method_name, method_dict):
-    """Run abstract interpreter on a single method and return dead offsets."""
-    import sys
-    sys.path.insert(0, 'solutions')
-    from jpamb import jvm
-    from components.abstract_interpreter import product_unbounded_run
+    """
+    Run abstract interpreter on a single method.
     
+    Returns (dead_offsets, visited_pcs), both as sorted lists of offsets.
+    """
     params = jvm.ParameterType.from_json(method_dict.get('params', []), annotated=True)
     returns_info = method_dict.get('returns', {})
     return_type_json = returns_info.get('type')
@@ -166,52 +493,32 @@ def run_abstract_interpreter_on_method(suite, classname, method_name, method_dic
     method_id = jvm.MethodID(name=method_name, params=params, return_type=return_type)
     abs_method = jvm.AbsMethodID(classname=classname, extension=method_id)
     
-    outcomes, visited_pcs = product_unbounded_run(suite, abs_method)
+    # Keyed by (classname, method signature); repeated queries reuse the run
+    visited_bits = _cached_product_run(suite, abs_method)
     
-    bytecode = method_dict['code']['bytecode']
-    all_pcs = {inst['offset'] for inst in bytecode}
-    unreachable = all_pcs - visited_pcs
+    all_bits = _offsets_to_bits(inst['offset'] for inst in method_dict['code']['bytecode'])
+    unreachable = _bits_to_offsets(all_bits & ~visited_bits)
     
-    return unreachable, visited_pcs
+    return unreachable, _bits_to_offsets(visited_bits)
 
 
-def main():
-    import sys
-    sys.path.insert(0, 'solutions')
-    import jpamb
-    from jpamb import jvm
-    
-    # Get javap output
-    class_file = 'target/classes/jpamb/cases/AbstractInterpreterCases.class'
-    result = subprocess.run(
-        ['javap', '-c', '-l', class_file],
-        capture_output=True, text=True
-    )
-    javap_output = result.stdout
-    
-    # Parse javap
-    javap_methods = parse_javap_output(javap_output)
+def analyze_class_with_javap(suite, class_file: Path, method_names: List[str]) -> None:
+    """
+    Compare javap ground truth with the abstract interpreter for one class.
     
-    print("=" * 70)
-    print("ABSTRACT INTERPRETER VERIFICATION (using javap as ground truth)")
-    print("=" * 70)
+    The suite is passed in so that callers checking several classes load it
+    only once.
+    """
+    javap_methods = parse_javap(class_file)
     
-    # Load suite and class
-    suite = jpamb.Suite()
-    classname = jvm.ClassName('jpamb/cases/AbstractInterpreterCases')
+    classname = jvm.ClassName(class_file_to_name(class_file))
     cls = suite.findclass(classname)
+    # First method of each name, as a linear search would find it for overloads
+    methods_by_name = {}
+    for m in cls['methods']:
+        methods_by_name.setdefault(m['name'], m)
     
-    # Test specific methods known to have dead code
-    test_methods = [
-        'contradictoryConditions',
-        'signContradiction', 
-        'positiveNotZero',
-        'rangeAnalysis',
-        'constantPropagation',
-        'arithmeticConstraints',
-    ]
-    
-    for method_name in test_methods:
+    for method_name in method_names:
         if method_name not in javap_methods:
             print(f"\n{method_name}: NOT FOUND in javap output")
             continue
@@ -219,11 +526,7 @@ def main():
         javap_method = javap_methods[method_name]
         
         # Find method in JSON
-        method_dict = None
-        for m in cls['methods']:
-            if m['name'] == method_name:
-                method_dict = m
-                break
+        method_dict = methods_by_name.get(method_name)
         
         if not method_dict:
             print(f"\n{method_name}: NOT FOUND in JSON")
@@ -247,7 +550,7 @@ def main():
         javap_offsets = javap_method.get_all_offsets()
         
         print(f"\nOFFSET COMPARISON:")
-        print(f"  javap offsets:  {sorted(javap_offsets)}")
+        print(f"  javap offsets:  {list(javap_method.get_sorted_offsets())}")
         print(f"  JSON offsets:   {sorted(json_offsets)}")
         
         if javap_offsets != json_offsets:
@@ -306,15 +609,15 @@ def main():
         
         # Show dead code detection results
         print(f"\nABSTRACT INTERPRETER RESULTS:")
-        print(f"  Visited offsets: {sorted(visited)}")
-        print(f"  Dead offsets:    {sorted(dead_offsets)}")
+        print(f"  Visited offsets: {visited}")
+        print(f"  Dead offsets:    {dead_offsets}")
         
         # Map dead offsets to lines using JAVAP line table (ground truth)
-        dead_lines_javap = set()
-        for offset in dead_offsets:
-            line = javap_method.get_line_for_offset(offset)
-            if line:
-                dead_lines_javap.add(line)
+        if NUMPY_AVAILABLE:
+            dead_lines = javap_method.lines_for_offsets_np(dead_offsets)
+            dead_lines_javap = set(dead_lines[dead_lines >= 0].tolist())
+        else:
+            dead_lines_javap = set(javap_method.lines_for_offsets(dead_offsets))
         
         # Map dead offsets to lines using JSON line table
         dead_lines_json = set()
@@ -332,6 +635,28 @@ def main():
             print(f"  ⚠️  Line mapping differs due to incorrect JSON line table!")
 
 
+def main():
+    class_file = Path(f'{_CLASSES_PREFIX}jpamb/cases/AbstractInterpreterCases.class')
+    
+    print("=" * 70)
+    print("ABSTRACT INTERPRETER VERIFICATION (using javap as ground truth)")
+    print("=" * 70)
+    
+    suite = jpamb.Suite()
+    
+    # Test specific methods known to have dead code
+    test_methods = [
+        'contradictoryConditions',
+        'signContradiction', 
+        'positiveNotZero',
+        'rangeAnalysis',
+        'constantPropagation',
+        'arithmeticConstraints',
+    ]
+    
+    analyze_class_with_javap(suite, class_file, test_methods)
+
+
 if __name__ == '__main__':
     main()
 